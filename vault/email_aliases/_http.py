@@ -0,0 +1,84 @@
+"""
+Shared HTTP plumbing for the SimpleLogin sub-clients.
+"""
+
+import asyncio
+import random
+
+import httpx
+
+# Transient failures worth retrying. ReadTimeout is only safe when the
+# request is idempotent — a timed-out POST may already have taken effect.
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+_IDEMPOTENT_ERRORS = _CONNECT_ERRORS + (httpx.ReadTimeout,)
+
+# Error bodies can be arbitrarily large (think HTML 502 pages from a proxy);
+# only this much is decoded into exception messages.
+_ERROR_BODY_LIMIT = 512
+
+
+def error_text(response: httpx.Response) -> str:
+    """
+    Decodes a bounded prefix of an error response body for exception messages.
+
+    Unlike `response.text`, this never UTF-8-decodes (or charset-sniffs) more
+    than _ERROR_BODY_LIMIT bytes, and undecodable bytes are replaced rather
+    than raising.
+    """
+    return response.content[:_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
+
+async def request_with_retry(client: httpx.AsyncClient, method: str, url: str,
+                             attempts: int = 3, idempotent: bool = True,
+                             **kwargs) -> httpx.Response:
+    """
+    Sends a request, retrying transient failures with jittered exponential
+    backoff (0.1s, 0.2s, ... plus jitter).
+
+    Idempotent requests also retry read timeouts and 5xx responses;
+    non-idempotent ones only retry errors raised before the request was sent,
+    so a timed-out POST is never duplicated.
+    """
+    retryable = _IDEMPOTENT_ERRORS if idempotent else _CONNECT_ERRORS
+    last_exc = None
+    for attempt in range(attempts):
+        if attempt:
+            await asyncio.sleep(2 ** (attempt - 1) * 0.1 + random.random() * 0.05)
+        try:
+            response = await client.request(method, url, **kwargs)
+        except retryable as e:
+            last_exc = e
+            continue
+        if idempotent and response.status_code >= 500 and attempt < attempts - 1:
+            continue
+        return response
+    raise last_exc
+
+
+async def hedged_get(client: httpx.AsyncClient, url: str,
+                     hedge_after: float = 0.4, **kwargs) -> httpx.Response:
+    """
+    GET with request hedging: if the first attempt hasn't answered within
+    `hedge_after` seconds, fire a duplicate and take whichever response lands
+    first, cancelling the loser. Masks tail latency on idempotent reads
+    without touching the fast path.
+    """
+    tasks = {asyncio.create_task(request_with_retry(client, "GET", url, **kwargs))}
+    done, tasks = await asyncio.wait(tasks, timeout=hedge_after)
+    if done:
+        return done.pop().result()
+
+    tasks.add(asyncio.create_task(request_with_retry(client, "GET", url, **kwargs)))
+    try:
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            # Prefer any completed response — both legs may land in the same
+            # wake-up, in arbitrary order; only raise once every leg failed.
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+            if not tasks:
+                raise next(iter(done)).exception()
+    finally:
+        for task in tasks:
+            task.cancel()
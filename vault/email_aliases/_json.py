@@ -0,0 +1,30 @@
+"""
+Shared JSON helpers for the SimpleLogin sub-clients.
+
+orjson (C extension) parses and serializes roughly 5x faster than stdlib
+json; fall back to stdlib when it isn't installed so the clients keep
+working without the optional dependency. Both helpers speak bytes, which
+is what httpx hands us (`response.content`) and accepts (`content=...`).
+"""
+
+try:
+    import orjson
+
+    def loads(data):
+        """Decodes JSON bytes/str into Python objects."""
+        return orjson.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Encodes a Python object to JSON bytes."""
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def loads(data):
+        """Decodes JSON bytes/str into Python objects."""
+        return json.loads(data)
+
+    def dumps(obj) -> bytes:
+        """Encodes a Python object to JSON bytes."""
+        return json.dumps(obj).encode("utf-8")
@@ -1,6 +1,24 @@
+import asyncio
+
 import httpx
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing import AsyncIterator, Final, Optional, List
+
+from email_aliases._http import error_text, hedged_get, request_with_retry
+from email_aliases._json import dumps as json_dumps
+
+# jiter (pydantic-core's JSON parser, published standalone) supports partial
+# parsing, which lets us decode aliases while the page is still downloading.
+try:
+    import jiter
+except ImportError:
+    jiter = None
+
+# API paths (appended to base_url once at construction time)
+ALIASES_PATH: Final[str] = "/api/v2/aliases"
+CREATE_ALIAS_PATH: Final[str] = "/api/v3/alias/custom/new"
+RANDOM_ALIAS_PATH: Final[str] = "/api/alias/random/new"
+DELETE_ALIAS_PATH: Final[str] = "/api/aliases/{id}"
 
 
 # ---------------------------------------------------------------------------
@@ -8,11 +26,13 @@ from typing import Optional, List
 # ---------------------------------------------------------------------------
 
 class Mailbox(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     id: int
     email: str
 
 
 class Alias(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     id: int
     email: str
     enabled: bool
@@ -21,19 +41,14 @@ class Alias(BaseModel):
 
 
 class AliasesResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     aliases: List[Alias]
 
 
-class CreateAliasRequest(BaseModel):
-    alias_prefix: str
-    signed_suffix: str
-    mailbox_ids: List[int]
-    note: Optional[str] = None
-    name: Optional[str] = None
-
-
-class CreateRandomAliasRequest(BaseModel):
-    note: Optional[str] = None
+# Prebuilt adapters for the hot response types — validating through these
+# skips re-resolving the schema on every call.
+_ALIASES_TA: TypeAdapter = TypeAdapter(AliasesResponse)
+_ALIAS_TA: TypeAdapter = TypeAdapter(Alias)
 
 
 # ---------------------------------------------------------------------------
@@ -41,6 +56,12 @@ class CreateRandomAliasRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 class AliasClient:
+    __slots__ = (
+        "base_url", "client",
+        "_aliases_url", "_create_alias_url", "_random_alias_url", "_delete_alias_url",
+        "_api_key", "_auth_headers", "_json_headers",
+    )
+
     def __init__(self, base_url: str, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         :param base_url: The API base URL.
@@ -48,9 +69,25 @@ class AliasClient:
         :param client: Optional existing httpx.AsyncClient.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
         # Use provided client or create a new one
         self.client = client if client else httpx.AsyncClient()
+        # Pre-build URLs once instead of f-string-assembling them per call
+        self._aliases_url = self.base_url + ALIASES_PATH
+        self._create_alias_url = self.base_url + CREATE_ALIAS_PATH
+        self._random_alias_url = self.base_url + RANDOM_ALIAS_PATH
+        self._delete_alias_url = self.base_url + DELETE_ALIAS_PATH
+        self.api_key = api_key  # setter also builds the cached header dict
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]):
+        self._api_key = value
+        # Cached so each request reuses one dict instead of rebuilding it
+        self._auth_headers = {"Authentication": value} if value else {}
+        self._json_headers = {**self._auth_headers, "Content-Type": "application/json"}
 
     async def list_aliases(self, page_id: int) -> AliasesResponse:
         """
@@ -59,21 +96,105 @@ class AliasClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/v2/aliases"
         params = {"page_id": page_id}
-        headers = {"Authentication": self.api_key}
 
         try:
-            response = await self.client.get(url, params=params, headers=headers)
+            response = await hedged_get(self.client, self._aliases_url, params=params, headers=self._auth_headers)
 
             if response.status_code == 200:
-                return AliasesResponse(**response.json())
+                return _ALIASES_TA.validate_json(response.content)
             else:
-                raise Exception(f"Failed to list aliases: {response.text}")
+                raise Exception(f"Failed to list aliases: {error_text(response)}")
+
+        except httpx.RequestError as e:
+            raise Exception(f"Network error occurred: {e}")
+
+    async def iter_aliases(self, page_id: int) -> AsyncIterator[Alias]:
+        """
+        Streams one page of aliases, yielding each alias as soon as its bytes
+        have arrived instead of waiting for the whole body.
+
+        With jiter installed, decoding overlaps the network transfer via
+        partial parsing; otherwise the page is buffered and parsed once, which
+        costs the same as list_aliases.
+        """
+        if not self.api_key:
+            raise ValueError("API Key not set")
+
+        params = {"page_id": page_id}
+
+        try:
+            async with self.client.stream(
+                    "GET", self._aliases_url, params=params, headers=self._auth_headers
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    raise Exception(f"Failed to list aliases: {error_text(response)}")
+
+                if jiter is None:
+                    # No partial parser available — buffer and parse in one go.
+                    await response.aread()
+                    for alias in _ALIASES_TA.validate_json(response.content).aliases:
+                        yield alias
+                    return
+
+                buf = bytearray()
+                yielded = 0
+                async for chunk in response.aiter_bytes():
+                    buf.extend(chunk)
+                    try:
+                        partial = jiter.from_json(bytes(buf), partial_mode="trailing-strings")
+                    except ValueError:
+                        continue
+                    entries = partial.get("aliases") or []
+                    # The last entry may be cut mid-object; hold it back until
+                    # more bytes (or end of stream) confirm it is complete.
+                    for entry in entries[yielded:len(entries) - 1]:
+                        yield _ALIAS_TA.validate_python(entry)
+                        yielded += 1
+                # Final parse over the complete body picks up the held-back tail.
+                for entry in (jiter.from_json(bytes(buf)).get("aliases") or [])[yielded:]:
+                    yield _ALIAS_TA.validate_python(entry)
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
 
+    async def list_all_aliases(self, concurrency: int = 4) -> AsyncIterator[Alias]:
+        """
+        Iterates over every alias across all pages.
+
+        Keeps `concurrency` page requests in flight at once (sliding window),
+        so server latency for later pages overlaps with parsing and yielding
+        earlier ones. Aliases are still yielded in page order. Stops at the
+        first empty page.
+        """
+        if not self.api_key:
+            raise ValueError("API Key not set")
+
+        # Pre-fetch the first window of pages, then keep the window full:
+        # whenever page N is consumed, page N + concurrency is scheduled.
+        pending = {
+            page_id: asyncio.create_task(self.list_aliases(page_id))
+            for page_id in range(concurrency)
+        }
+        next_page = 0
+        try:
+            while pending:
+                response = await pending.pop(next_page)
+                if not response.aliases:
+                    return
+                for alias in response.aliases:
+                    yield alias
+                follow_up = next_page + concurrency
+                pending[follow_up] = asyncio.create_task(self.list_aliases(follow_up))
+                next_page += 1
+        finally:
+            # Cancel speculative fetches past the end (or on caller break).
+            for task in pending.values():
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending.values(), return_exceptions=True)
+
     async def create_alias(
             self,
             alias_prefix: str,
@@ -88,27 +209,33 @@ class AliasClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/v3/alias/custom/new"
-        headers = {"Authentication": self.api_key}
-
-        payload = CreateAliasRequest(
-            alias_prefix=alias_prefix,
-            signed_suffix=signed_suffix,
-            mailbox_ids=mailbox_ids,
-            note=note,
-            name=name
-        )
-
-        # use exclude_none=True to mimic Rust's skip_serializing_if = "Option::is_none"
-        json_body = payload.model_dump(exclude_none=True)
+        # The signature already expresses everything the old request model
+        # validated, so build the body directly; skipping None entries mimics
+        # Rust's skip_serializing_if = "Option::is_none".
+        json_body = {
+            k: v
+            for k, v in (
+                ("alias_prefix", alias_prefix),
+                ("signed_suffix", signed_suffix),
+                ("mailbox_ids", mailbox_ids),
+                ("note", note),
+                ("name", name),
+            )
+            if v is not None
+        }
 
         try:
-            response = await self.client.post(url, headers=headers, json=json_body)
+            response = await request_with_retry(
+                self.client, "POST", self._create_alias_url,
+                idempotent=False,
+                headers=self._json_headers,
+                content=json_dumps(json_body),
+            )
 
             if response.status_code == 201:
-                return Alias(**response.json())
+                return _ALIAS_TA.validate_json(response.content)
             else:
-                raise Exception(f"Failed to create alias: {response.text}")
+                raise Exception(f"Failed to create alias: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -125,9 +252,6 @@ class AliasClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/alias/random/new"
-        headers = {"Authentication": self.api_key}
-
         # Build query parameters
         params = {}
         if hostname:
@@ -135,16 +259,21 @@ class AliasClient:
         if mode:
             params["mode"] = mode
 
-        payload = CreateRandomAliasRequest(note=note)
-        json_body = payload.model_dump(exclude_none=True)
+        json_body = {"note": note} if note is not None else {}
 
         try:
-            response = await self.client.post(url, headers=headers, params=params, json=json_body)
+            response = await request_with_retry(
+                self.client, "POST", self._random_alias_url,
+                idempotent=False,
+                headers=self._json_headers,
+                params=params,
+                content=json_dumps(json_body),
+            )
 
             if response.status_code == 201:
-                return Alias(**response.json())
+                return _ALIAS_TA.validate_json(response.content)
             else:
-                raise Exception(f"Failed to create random alias: {response.text}")
+                raise Exception(f"Failed to create random alias: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -156,16 +285,15 @@ class AliasClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/aliases/{alias_id}"
-        headers = {"Authentication": self.api_key}
+        url = self._delete_alias_url.format(id=alias_id)
 
         try:
-            response = await self.client.delete(url, headers=headers)
+            response = await request_with_retry(self.client, "DELETE", url, headers=self._auth_headers)
 
             if response.status_code == 200:
                 return True
             else:
-                raise Exception(f"Failed to delete alias: {response.text}")
+                raise Exception(f"Failed to delete alias: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
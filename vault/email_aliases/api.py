@@ -1,3 +1,6 @@
+import asyncio
+import importlib.util
+
 import httpx
 from typing import Optional
 
@@ -7,18 +10,75 @@ from email_aliases.user import UserClient
 from email_aliases.auth import AuthClient
 
 
+# h2 (optional): httpx raises at client construction if http2=True is
+# requested without it, so enable HTTP/2 only when the extra is installed.
+_HAVE_H2 = importlib.util.find_spec("h2") is not None
+
+# Shared clients, one per event loop. Keeping a pool alive across client
+# instances preserves warm TCP/TLS connections — but httpx connections are
+# bound to the loop they were opened on, so a pool from a finished loop
+# (e.g. after asyncio.run returned) must not be handed to a new one.
+_DEFAULT_CLIENTS: dict = {}
+
+
+def _current_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _build_client() -> httpx.AsyncClient:
+    # HTTP/2 lets concurrent calls (e.g. asyncio.gather over sub-clients)
+    # multiplex over one TCP connection instead of opening one per request.
+    return httpx.AsyncClient(
+        http2=_HAVE_H2,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        timeout=httpx.Timeout(10.0, connect=3.0),
+    )
+
+
+def _default_client() -> httpx.AsyncClient:
+    """Lazily creates the shared httpx client for the running event loop."""
+    loop = _current_loop()
+    if loop is None:
+        # Constructed outside any loop: hand back a private client instead
+        # of caching one — a cached entry would bind its pool to whichever
+        # loop touches it first and then be shared with every later loop.
+        return _build_client()
+    client = _DEFAULT_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        # Prune pools whose loops have exited; their connections are dead.
+        for stale in [l for l in _DEFAULT_CLIENTS if l.is_closed()]:
+            _DEFAULT_CLIENTS.pop(stale, None)
+        client = _DEFAULT_CLIENTS[loop] = _build_client()
+    return client
+
+
+async def aclose_default_client():
+    """Closes the current loop's shared pool. Call once at application shutdown."""
+    loop = _current_loop()
+    client = _DEFAULT_CLIENTS.pop(loop, None) if loop is not None else None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
 class SimpleLoginClient:
-    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.simplelogin.io"):
+    __slots__ = ("base_url", "client", "auth", "user", "aliases", "mailboxes", "_warmup")
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = "https://api.simplelogin.io",
+                 client: Optional[httpx.AsyncClient] = None):
         """
         Initializes the main client which acts as a wrapper for all sub-clients.
 
         :param api_key: The API key for authenticated endpoints.
         :param base_url: The API base URL (defaults to official SimpleLogin API).
+        :param client: Optional httpx.AsyncClient; defaults to the module-level
+                       shared pool so TLS sessions stay warm across instances.
         """
         self.base_url = base_url.rstrip("/")
 
-        # We create a single shared httpx Client for connection pooling
-        self.client = httpx.AsyncClient()
+        self.client = client if client else _default_client()
 
         # Initialize sub-clients with the shared http client
         self.auth = AuthClient(base_url=self.base_url, client=self.client)
@@ -41,14 +101,46 @@ class SimpleLoginClient:
             client=self.client
         )
 
+        self._warmup: Optional[asyncio.Task] = None
+
+    def set_api_key(self, api_key: Optional[str]):
+        """
+        Swaps the API key on all sub-clients in place.
+
+        Prefer this over constructing a second SimpleLoginClient after login:
+        a new instance would tear down and rebuild the connection pool, paying
+        a fresh TLS handshake for no reason.
+        """
+        self.user.api_key = api_key
+        self.aliases.api_key = api_key
+        self.mailboxes.api_key = api_key
+
     async def close(self):
-        """Closes the underlying shared HTTP client."""
-        await self.client.aclose()
+        """
+        Closes the underlying HTTP client, unless it is the module-level
+        shared pool (closed via aclose_default_client at shutdown).
+        """
+        if self.client not in _DEFAULT_CLIENTS.values():
+            await self.client.aclose()
+
+    async def _warm_up(self):
+        try:
+            await self.client.head(self.base_url + "/")
+        except Exception:
+            # Best-effort: the point was the TCP/TLS handshake, not the
+            # response. Any real problem surfaces on the first actual request.
+            pass
 
     async def __aenter__(self):
+        # Start the TCP/TLS handshake (and HTTP/2 SETTINGS exchange) in the
+        # background so the first real request finds a warm connection,
+        # saving a round-trip of first-call latency.
+        self._warmup = asyncio.create_task(self._warm_up())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._warmup is not None and not self._warmup.done():
+            self._warmup.cancel()
         await self.close()
 
 
@@ -66,18 +158,18 @@ if __name__ == "__main__":
         # Usage with context manager (auto-closes connection)
         async with SimpleLoginClient(api_key="my-secret-key") as sl:
 
-            # 1. Use the User sub-client
-            try:
-                user_info = await sl.user.get_user_info()
-                print(f"User: {user_info.name}")
-            except Exception as e:
-                print(f"User fetch failed: {e}")
-
-            # 2. Use the Mailbox sub-client
+            # User info and mailboxes are independent calls — fetch them
+            # concurrently so we only wait for the slower of the two.
             try:
-                boxes = await sl.mailboxes.list_mailboxes()
-                print(f"Found {len(boxes.mailboxes)} mailboxes.")
-            except Exception as e:
-                print(f"Mailbox fetch failed: {e}")
+                async with asyncio.TaskGroup() as tg:
+                    user_task = tg.create_task(sl.user.get_user_info())
+                    boxes_task = tg.create_task(sl.mailboxes.list_mailboxes())
+            except ExceptionGroup as eg:
+                for e in eg.exceptions:
+                    print(f"Fetch failed: {e}")
+                return
+
+            print(f"User: {user_task.result().name}")
+            print(f"Found {len(boxes_task.result().mailboxes)} mailboxes.")
 
     # asyncio.run(main())
\ No newline at end of file
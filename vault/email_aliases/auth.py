@@ -1,6 +1,15 @@
 import httpx
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, ConfigDict
+
+from email_aliases._http import error_text, request_with_retry
+from typing import Final, Optional
+
+# API paths (appended to base_url once at construction time)
+LOGIN_PATH: Final[str] = "/api/auth/login"
+REGISTER_PATH: Final[str] = "/api/auth/register"
+ACTIVATE_PATH: Final[str] = "/api/auth/activate"
+
+_JSON_HEADERS: Final[dict] = {"Content-Type": "application/json"}
 
 
 # ---------------------------------------------------------------------------
@@ -8,12 +17,14 @@ from typing import Optional
 # ---------------------------------------------------------------------------
 
 class LoginRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     email: str
     password: str
     device: str
 
 
 class LoginResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     name: str
     email: str
     mfa_enabled: bool
@@ -22,11 +33,13 @@ class LoginResponse(BaseModel):
 
 
 class ActivateRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     email: str
     code: str
 
 
 class RegisterRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     email: str
     password: str
 
@@ -36,6 +49,8 @@ class RegisterRequest(BaseModel):
 # ---------------------------------------------------------------------------
 
 class AuthClient:
+    __slots__ = ("base_url", "client", "_login_url", "_register_url", "_activate_url")
+
     def __init__(self, base_url: str, client: Optional[httpx.AsyncClient] = None):
         """
         :param base_url: The API base URL.
@@ -46,49 +61,65 @@ class AuthClient:
         # In Python, we usually pass the client in or manage it via a context manager.
         # Here we store it to match the Rust struct structure.
         self.client = client if client else httpx.AsyncClient()
+        # Pre-build URLs once instead of f-string-assembling them per call
+        self._login_url = self.base_url + LOGIN_PATH
+        self._register_url = self.base_url + REGISTER_PATH
+        self._activate_url = self.base_url + ACTIVATE_PATH
 
     async def login(self, email: str, password: str, device: str) -> LoginResponse:
-        url = f"{self.base_url}/api/auth/login"
         payload = LoginRequest(email=email, password=password, device=device)
 
         try:
-            response = await self.client.post(url, json=payload.model_dump())
+            response = await request_with_retry(
+                self.client, "POST", self._login_url,
+                idempotent=False,
+                content=payload.model_dump_json(),
+                headers=_JSON_HEADERS,
+            )
 
             if response.status_code == 200:
-                # Parse JSON into Pydantic model
-                return LoginResponse(**response.json())
+                # Parse JSON straight into the Pydantic model (single pass)
+                return LoginResponse.model_validate_json(response.content)
 
             elif response.status_code == 403:
                 raise Exception("FIDO enabled, use API Key instead")
 
             else:
                 # Capture text from error response
-                raise Exception(f"Login failed: {response.text}")
+                raise Exception(f"Login failed: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
 
     async def register(self, email: str, password: str) -> None:
-        url = f"{self.base_url}/api/auth/register"
         payload = RegisterRequest(email=email, password=password)
 
         try:
-            response = await self.client.post(url, json=payload.model_dump())
+            response = await request_with_retry(
+                self.client, "POST", self._register_url,
+                idempotent=False,
+                content=payload.model_dump_json(),
+                headers=_JSON_HEADERS,
+            )
 
             if response.is_success:
                 return None
             else:
-                raise Exception(f"Registration failed: {response.text}")
+                raise Exception(f"Registration failed: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
 
     async def activate(self, email: str, code: str) -> None:
-        url = f"{self.base_url}/api/auth/activate"
         payload = ActivateRequest(email=email, code=code)
 
         try:
-            response = await self.client.post(url, json=payload.model_dump())
+            response = await request_with_retry(
+                self.client, "POST", self._activate_url,
+                idempotent=False,
+                content=payload.model_dump_json(),
+                headers=_JSON_HEADERS,
+            )
 
             if response.status_code == 200:
                 return None
@@ -100,7 +131,7 @@ class AuthClient:
                 raise Exception("Too many failed attempts. Request reactivation")
 
             else:
-                raise Exception(f"Activation failed: {response.text}")
+                raise Exception(f"Activation failed: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -1,6 +1,11 @@
 import httpx
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from email_aliases._http import error_text, hedged_get
+from typing import Final, List, Optional
+
+# API path (appended to base_url once at construction time)
+MAILBOXES_PATH: Final[str] = "/api/v2/mailboxes"
 
 
 # ---------------------------------------------------------------------------
@@ -8,6 +13,7 @@ from typing import List, Optional
 # ---------------------------------------------------------------------------
 
 class Mailbox(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     id: int
     email: str
     default: bool
@@ -17,14 +23,21 @@ class Mailbox(BaseModel):
 
 
 class MailboxesResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     mailboxes: List[Mailbox]
 
 
+# Prebuilt adapter for the hot response type
+_MAILBOXES_TA: TypeAdapter = TypeAdapter(MailboxesResponse)
+
+
 # ---------------------------------------------------------------------------
 # Client Implementation
 # ---------------------------------------------------------------------------
 
 class MailboxClient:
+    __slots__ = ("base_url", "client", "_mailboxes_url", "_api_key", "_auth_headers")
+
     def __init__(self, base_url: str, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         :param base_url: The API base URL.
@@ -32,9 +45,21 @@ class MailboxClient:
         :param client: Optional existing httpx.AsyncClient.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
         # Use provided client or create a new one
         self.client = client if client else httpx.AsyncClient()
+        # Pre-build the URL once instead of f-string-assembling it per call
+        self._mailboxes_url = self.base_url + MAILBOXES_PATH
+        self.api_key = api_key  # setter also builds the cached header dict
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]):
+        self._api_key = value
+        # Cached so each request reuses one dict instead of rebuilding it
+        self._auth_headers = {"Authentication": value} if value else {}
 
     async def list_mailboxes(self) -> MailboxesResponse:
         """
@@ -44,20 +69,14 @@ class MailboxClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/v2/mailboxes"
-
-        # Matches Rust's .header("Authentication", api_key)
-        headers = {
-            "Authentication": self.api_key
-        }
-
         try:
-            response = await self.client.get(url, headers=headers)
+            # Matches Rust's .header("Authentication", api_key)
+            response = await hedged_get(self.client, self._mailboxes_url, headers=self._auth_headers)
 
             if response.is_success:
-                return MailboxesResponse(**response.json())
+                return _MAILBOXES_TA.validate_json(response.content)
             else:
-                raise Exception(f"Failed to list mailboxes: {response.text}")
+                raise Exception(f"Failed to list mailboxes: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -1,7 +1,13 @@
-from typing import Optional
+from typing import Final, Optional
 
 import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from email_aliases._http import error_text, hedged_get, request_with_retry
+
+# API paths (appended to base_url once at construction time)
+USER_INFO_PATH: Final[str] = "/api/user_info"
+API_KEY_PATH: Final[str] = "/api/api_key"
 
 
 # ---------------------------------------------------------------------------
@@ -9,6 +15,7 @@ from pydantic import BaseModel
 # ---------------------------------------------------------------------------
 
 class UserInfo(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     name: str
     is_premium: bool
     email: str
@@ -18,18 +25,26 @@ class UserInfo(BaseModel):
 
 
 class ApiKeyRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     device: str
 
 
 class ApiKeyResponse(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     api_key: str
 
 
+# Prebuilt adapter for the hot response type
+_USER_INFO_TA: TypeAdapter = TypeAdapter(UserInfo)
+
+
 # ---------------------------------------------------------------------------
 # Client Implementation
 # ---------------------------------------------------------------------------
 
 class UserClient:
+    __slots__ = ("base_url", "client", "_user_info_url", "_api_key_url", "_api_key", "_auth_headers")
+
     def __init__(self, base_url: str, api_key: Optional[str] = None, client: Optional[httpx.AsyncClient] = None):
         """
         :param base_url: The API base URL.
@@ -37,8 +52,21 @@ class UserClient:
         :param client: Optional existing httpx.AsyncClient.
         """
         self.base_url = base_url.rstrip("/")
-        self.api_key = api_key
         self.client = client if client else httpx.AsyncClient()
+        # Pre-build URLs once instead of f-string-assembling them per call
+        self._user_info_url = self.base_url + USER_INFO_PATH
+        self._api_key_url = self.base_url + API_KEY_PATH
+        self.api_key = api_key  # setter also builds the cached header dict
+
+    @property
+    def api_key(self) -> Optional[str]:
+        return self._api_key
+
+    @api_key.setter
+    def api_key(self, value: Optional[str]):
+        self._api_key = value
+        # Cached so each request reuses one dict instead of rebuilding it
+        self._auth_headers = {"Authentication": value} if value else {}
 
     async def get_user_info(self) -> UserInfo:
         """
@@ -47,18 +75,15 @@ class UserClient:
         if not self.api_key:
             raise ValueError("API Key not set")
 
-        url = f"{self.base_url}/api/user_info"
-        headers = {"Authentication": self.api_key}
-
         try:
-            response = await self.client.get(url, headers=headers)
+            response = await hedged_get(self.client, self._user_info_url, headers=self._auth_headers)
 
             if response.status_code == 200:
-                return UserInfo(**response.json())
+                return _USER_INFO_TA.validate_json(response.content)
             elif response.status_code == 401:
                 raise Exception("Invalid API Key")
             else:
-                raise Exception(f"Failed to fetch user info: {response.text}")
+                raise Exception(f"Failed to fetch user info: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -67,20 +92,25 @@ class UserClient:
         """
         Creates a new API key using a temporary login token/key.
         """
-        url = f"{self.base_url}/api/api_key"
-        # Note: Uses the passed `login_api_key`, not the stored `self.api_key`
+        # Note: Uses the passed `login_api_key`, not the stored `self.api_key`,
+        # so this header cannot come from the cached dict.
         headers = {"Authentication": login_api_key}
         payload = ApiKeyRequest(device=device)
 
         try:
-            response = await self.client.post(url, headers=headers, json=payload.model_dump())
+            response = await request_with_retry(
+                self.client, "POST", self._api_key_url,
+                idempotent=False,
+                content=payload.model_dump_json(),
+                headers={**headers, "Content-Type": "application/json"},
+            )
 
             if response.status_code == 201:  # Matches reqwest::StatusCode::CREATED
-                return ApiKeyResponse(**response.json())
+                return ApiKeyResponse.model_validate_json(response.content)
             elif response.status_code == 401:
                 raise Exception("Unauthorized")
             else:
-                raise Exception(f"Failed to create API Key: {response.text}")
+                raise Exception(f"Failed to create API Key: {error_text(response)}")
 
         except httpx.RequestError as e:
             raise Exception(f"Network error occurred: {e}")
@@ -5,6 +5,14 @@ from dotenv import load_dotenv
 
 from email_aliases.api import SimpleLoginClient
 
+# uvloop (optional, preferred): libuv-backed event loop, noticeably faster
+# than the default selector loop on socket-heavy workloads.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 async def main():
     # Load environment variables from .env file
@@ -39,27 +47,28 @@ async def main():
         api_key = os.getenv("SL_API_KEY")
         print(f"Logged in! API Key: {api_key}")
 
-    # We start a new session now that we have the key
-    async with SimpleLoginClient(api_key=api_key) as client:
+        # Swap the key in place — reusing the client keeps the warm
+        # connection pool instead of paying a second TLS handshake.
+        client.set_api_key(api_key)
 
-        # 5️⃣ Get alias options
+        # 5️⃣ List existing aliases and create a random one.
+        # The two calls are independent, so fan them out concurrently instead
+        # of paying one round-trip after the other.
         try:
-            alias_options = await client.aliases.list_aliases(page_id=0)
-            print(f"Existing aliases: {alias_options.aliases}")
-        except Exception as e:
-            print(f"Failed to list aliases: {e}")
+            async with asyncio.TaskGroup() as tg:
+                aliases_task = tg.create_task(client.aliases.list_aliases(page_id=0))
+                random_task = tg.create_task(client.aliases.create_random_alias(
+                    hostname="example.com",  # optional
+                    mode="word",  # optional: "uuid" or "word"
+                    note="My random alias note"
+                ))
+        except ExceptionGroup as eg:
+            for e in eg.exceptions:
+                print(f"Alias request failed: {e}")
             return
 
-        # Create a random alias
-        try:
-            random_alias = await client.aliases.create_random_alias(
-                hostname="example.com",  # optional
-                mode="word",  # optional: "uuid" or "word"
-                note="My random alias note"
-            )
-            print(f"Random alias created: {random_alias}")
-        except Exception as e:
-            print(f"Failed to create random alias: {e}")
+        print(f"Existing aliases: {aliases_task.result().aliases}")
+        print(f"Random alias created: {random_task.result()}")
 
 
 if __name__ == "__main__":
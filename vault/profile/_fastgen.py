@@ -0,0 +1,32 @@
+"""
+Optional numpy-accelerated batch username generation.
+
+For very large batches the per-name cost in the pure-Python path is
+dominated by RNG draws. numpy's PCG64 generator produces all component
+indices for the batch in a handful of vectorized calls; only the final
+string assembly stays in Python. Imported lazily by profile.generator
+and skipped entirely when numpy is not installed.
+"""
+
+import numpy as np
+
+
+def generate_usernames_bulk(n, adjectives, nouns, suffixes, formats, seed=None):
+    """
+    Generates `n` usernames using vectorized index draws.
+
+    The word tables and format functions are passed in by the caller
+    (profile.generator) so this module carries no copy of them.
+    """
+    gen = np.random.default_rng(seed)
+    adj_idx = gen.integers(0, len(adjectives), size=n)
+    noun_idx = gen.integers(0, len(nouns), size=n)
+    suf_idx = gen.integers(0, len(suffixes), size=n)
+    fmt_idx = gen.integers(0, len(formats), size=n)
+    # Match the pure-Python range: randint(10, 9998) inclusive.
+    nums = gen.integers(10, 9999, size=n)
+
+    return [
+        formats[f](adjectives[a], nouns[w], int(num), suffixes[s])
+        for f, a, w, num, s in zip(fmt_idx, adj_idx, noun_idx, nums, suf_idx)
+    ]
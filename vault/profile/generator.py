@@ -1,72 +1,115 @@
 import random
-
-
-def generate_username() -> str:
+from typing import Optional
+
+# numpy-accelerated bulk path (optional, preferred for very large batches)
+try:
+    from ._fastgen import generate_usernames_bulk as _generate_usernames_bulk
+    HAVE_FASTGEN = True
+except ImportError:
+    HAVE_FASTGEN = False
+
+# Below this batch size the vectorized path's setup cost outweighs the win.
+_BULK_THRESHOLD = 1024
+
+# Word tables live at module scope as tuples so calls don't rebuild them;
+# tuples are immutable and slightly faster to index than lists.
+ADJECTIVES = (
+    "Ancient", "Bright", "Curious", "Dizzy", "Electric", "Fuzzy",
+    "Gentle", "Hidden", "Jolly", "Kind", "Lucky", "Mighty", "Noisy",
+    "Odd", "Proud", "Quick", "Rare", "Silly", "Tiny", "Vivid", "Witty"
+)
+
+NOUNS = (
+    "Falcon", "Wanderer", "Otter", "Nebula", "Shadow", "Wizard",
+    "Phoenix", "Koala", "Comet", "Knight", "Golem", "Tiger", "Cloud",
+    "Blizzard", "Cricket", "Raven", "Puma", "Cobra", "Breeze", "Flame"
+)
+
+SUFFIXES = ("x", "v2", "alpha", "42", "99", "zero", "nova", "2025")
+
+FIRST_NAMES = (
+    "Lena", "Kai", "Nova", "Arlo", "Sasha", "Ezra", "Rhea", "Juno", "Milo", "Niko",
+    "Lyra", "Theo", "Astra", "Orin", "Zara", "Calix", "Nia", "Elio", "Tova", "Kian"
+)
+
+LAST_NAMES = (
+    "Moon", "Wraith", "Redwood", "Stone", "Nightwalker", "Flameborn", "Storm",
+    "Dusk", "Ironwood", "Ashcroft", "Winter", "Blackthorn", "Starling",
+    "Brightwind", "Frost", "Hollow", "Raven", "Skydancer", "Thorne", "Wolfhart"
+)
+
+# Formatting patterns (equivalent to Rust closures).
+# All lambdas accept (adj, noun, num, suf) even if they don't use all of them.
+FORMATS = (
+    # Format: AdjectiveNounNumber (e.g., AncientFalcon123)
+    lambda adj, noun, num, suf: f"{adj}{noun}{num}",
+
+    # Format: adj_noun_num (e.g., ancient_falcon_123)
+    lambda adj, noun, num, suf: f"{adj.lower()}_{noun.lower()}_{num}",
+
+    # Format: AdjectiveNounSuffix (e.g., AncientFalconAlpha)
+    lambda adj, noun, num, suf: f"{adj}{noun}{suf}",
+
+    # Format: NounNumberAdjective (e.g., Falcon123Ancient)
+    lambda adj, noun, num, suf: f"{noun}{num}{adj}",
+
+    # Format: SuffixAdjectiveNounNumber (e.g., xAncientFalcon123)
+    lambda adj, noun, num, suf: f"{suf}{adj}{noun}{num}",
+)
+
+
+def generate_username(rng: Optional[random.Random] = None) -> str:
     """
     Generates a random username using various formats (CamelCase, snake_case, etc.).
-    """
-    adjectives = [
-        "Ancient", "Bright", "Curious", "Dizzy", "Electric", "Fuzzy",
-        "Gentle", "Hidden", "Jolly", "Kind", "Lucky", "Mighty", "Noisy",
-        "Odd", "Proud", "Quick", "Rare", "Silly", "Tiny", "Vivid", "Witty"
-    ]
-
-    nouns = [
-        "Falcon", "Wanderer", "Otter", "Nebula", "Shadow", "Wizard",
-        "Phoenix", "Koala", "Comet", "Knight", "Golem", "Tiger", "Cloud",
-        "Blizzard", "Cricket", "Raven", "Puma", "Cobra", "Breeze", "Flame"
-    ]
-
-    suffixes = ["x", "v2", "alpha", "42", "99", "zero", "nova", "2025"]
-
-    # Define formatting patterns using lambdas (equivalent to Rust closures).
-    # All lambdas accept (adj, noun, num, suf) even if they don't use all of them.
-    formats = [
-        # Format: AdjectiveNounNumber (e.g., AncientFalcon123)
-        lambda adj, noun, num, suf: f"{adj}{noun}{num}",
-
-        # Format: adj_noun_num (e.g., ancient_falcon_123)
-        lambda adj, noun, num, suf: f"{adj.lower()}_{noun.lower()}_{num}",
-
-        # Format: AdjectiveNounSuffix (e.g., AncientFalconAlpha)
-        lambda adj, noun, num, suf: f"{adj}{noun}{suf}",
 
-        # Format: NounNumberAdjective (e.g., Falcon123Ancient)
-        lambda adj, noun, num, suf: f"{noun}{num}{adj}",
-
-        # Format: SuffixAdjectiveNounNumber (e.g., xAncientFalcon123)
-        lambda adj, noun, num, suf: f"{suf}{adj}{noun}{num}",
-    ]
+    Pass a dedicated `random.Random` (e.g. one per thread) when generating
+    batches to avoid contending on the shared module-level generator.
+    """
+    _rng = rng or random
+    _choice = _rng.choice
 
     # Select random components
-    adj = random.choice(adjectives)
-    noun = random.choice(nouns)
+    adj = _choice(ADJECTIVES)
+    noun = _choice(NOUNS)
     # Rust 10..9999 is exclusive of the upper bound.
     # Python randint is inclusive, so we use 9998.
-    number = random.randint(10, 9998)
-    suffix = random.choice(suffixes)
+    number = _rng.randint(10, 9998)
+    suffix = _choice(SUFFIXES)
 
     # Select a random format function and execute it
-    formatter = random.choice(formats)
+    formatter = _choice(FORMATS)
     return formatter(adj, noun, number, suffix)
 
 
-def generate_first_name() -> str:
-    first_names = [
-        "Lena", "Kai", "Nova", "Arlo", "Sasha", "Ezra", "Rhea", "Juno", "Milo", "Niko",
-        "Lyra", "Theo", "Astra", "Orin", "Zara", "Calix", "Nia", "Elio", "Tova", "Kian"
-    ]
-    return random.choice(first_names)
+def generate_usernames(n: int, rng: Optional[random.Random] = None) -> list:
+    """
+    Generates `n` usernames in one shot.
+
+    random.choices draws all samples for a table in a single C-level call,
+    amortizing the RNG overhead that generate_username pays per component.
+    Very large batches take the numpy-vectorized path when available.
+    """
+    if HAVE_FASTGEN and rng is None and n >= _BULK_THRESHOLD:
+        return _generate_usernames_bulk(n, ADJECTIVES, NOUNS, SUFFIXES, FORMATS)
+
+    _rng = rng if rng is not None else random
+    _choices = _rng.choices
+    adjs = _choices(ADJECTIVES, k=n)
+    nouns = _choices(NOUNS, k=n)
+    sufs = _choices(SUFFIXES, k=n)
+    fmts = _choices(FORMATS, k=n)
+    _randint = _rng.randint
+    nums = [_randint(10, 9998) for _ in range(n)]
+    return [f(a, w, num, s) for f, a, w, num, s in zip(fmts, adjs, nouns, nums, sufs)]
+
+
+def generate_first_name(rng: Optional[random.Random] = None) -> str:
+    return (rng or random).choice(FIRST_NAMES)
 
 
-def generate_last_name() -> str:
-    last_names = [
-        "Moon", "Wraith", "Redwood", "Stone", "Nightwalker", "Flameborn", "Storm",
-        "Dusk", "Ironwood", "Ashcroft", "Winter", "Blackthorn", "Starling",
-        "Brightwind", "Frost", "Hollow", "Raven", "Skydancer", "Thorne", "Wolfhart"
-    ]
-    return random.choice(last_names)
+def generate_last_name(rng: Optional[random.Random] = None) -> str:
+    return (rng or random).choice(LAST_NAMES)
 
 
-def generate_full_name() -> str:
-    return f"{generate_first_name()} {generate_last_name()}"
\ No newline at end of file
+def generate_full_name(rng: Optional[random.Random] = None) -> str:
+    return f"{generate_first_name(rng)} {generate_last_name(rng)}"
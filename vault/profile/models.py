@@ -1,8 +1,15 @@
+import time
 from enum import Enum
-from typing import Optional
-from datetime import datetime, date
+from typing import List, Optional
+from datetime import date
 from uuid import UUID
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
+
+# orjson (optional, preferred) for consumers that want raw dicts
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # ---------------------------------------------------------------------------
 # Mocks for types imported from crate::profile::types
@@ -25,20 +32,27 @@ class TrustLevel(str, Enum):
 class Audit(BaseModel):
     """
     Corresponds to the Rust Audit struct.
-    Note: Rust uses `ts_seconds` (Unix timestamp integer).
-    Pydantic defaults to ISO8601 strings for JSON.
-    To strictly match Rust's JSON output (int), custom serializers would be needed.
+    Rust uses `ts_seconds` (Unix timestamp integer); storing plain ints here
+    matches that JSON output exactly and skips Pydantic's per-field ISO8601
+    formatting on every serialization.
     """
-    created_at: datetime
-    updated_at: datetime
-    last_used_at: datetime
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    created_at: int = Field(description="unix seconds")
+    updated_at: int = Field(description="unix seconds")
+    last_used_at: int = Field(description="unix seconds")
+
+    @classmethod
+    def now_ts(cls) -> int:
+        return int(time.time())
 
 class Credentials(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     username: Optional[str] = None
     email: str
     password_ref: Optional[str] = None
 
 class Address(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     apartment: Optional[str] = None
     street: Optional[str] = None
     city: Optional[str] = None
@@ -47,6 +61,7 @@ class Address(BaseModel):
     country: Optional[str] = None
 
 class Passport(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     number: str
     country: str
     expiration_date: Optional[date] = None
@@ -55,10 +70,12 @@ class Passport(BaseModel):
     authority: Optional[str] = None
 
 class LegalDocuments(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     passport: Optional[Passport] = None
     ssn: Optional[str] = None
 
 class PII(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     middle_name: Optional[str] = None
@@ -71,7 +88,19 @@ class PII(BaseModel):
     nationality: Optional[str] = None
     legal_documents: Optional[LegalDocuments] = None
 
+def _coerce_uuid(v):
+    """
+    Fast path for ids persisted as raw 16-byte UUIDs: UUID(bytes=...) skips
+    the 36-char hyphenated-string parse (and halves the stored size).
+    Strings and UUID instances fall through to pydantic's normal handling.
+    """
+    if isinstance(v, (bytes, bytearray)) and len(v) == 16:
+        return UUID(bytes=bytes(v))
+    return v
+
+
 class Profile(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     id: UUID
     domain: str
     title: str
@@ -79,7 +108,10 @@ class Profile(BaseModel):
     pii: Optional[PII] = None
     audit: Audit
 
+    _coerce_id = field_validator("id", mode="before")(_coerce_uuid)
+
 class ProfileIndex(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore")
     id: UUID
     domain: str
     title: str
@@ -87,15 +119,46 @@ class ProfileIndex(BaseModel):
     trust_level: TrustLevel
     version: int
 
+    _coerce_id = field_validator("id", mode="before")(_coerce_uuid)
+
+# ---------------------------------------------------------------------------
+# Bulk loaders
+# ---------------------------------------------------------------------------
+
+# Prebuilt adapter so bulk loads resolve the schema once at import, not per file
+PROFILE_INDEX_LIST_TA: TypeAdapter = TypeAdapter(List[ProfileIndex])
+
+
+def load_profile_indexes(raw: bytes) -> List[ProfileIndex]:
+    """
+    Validates a whole JSON array of profile-index entries in one pass.
+
+    Prefer this over looping ProfileIndex.model_validate_json per entry when
+    scanning a profile directory — one adapter call validates the full list.
+    """
+    return PROFILE_INDEX_LIST_TA.validate_json(raw)
+
+
+def load_profile_index_dicts(raw: bytes) -> list:
+    """
+    Decodes the same JSON array to plain dicts, skipping validation entirely.
+
+    For list-only consumers (e.g. rendering titles in a picker) that don't
+    need typed objects.
+    """
+    return _json.loads(raw)
+
+
 # ---------------------------------------------------------------------------
 # Example Usage (Demonstrating Serialization)
 # ---------------------------------------------------------------------------
 if __name__ == "__main__":
     # Create an example Audit
+    now = Audit.now_ts()
     audit_log = Audit(
-        created_at=datetime.utcnow(),
-        updated_at=datetime.utcnow(),
-        last_used_at=datetime.utcnow()
+        created_at=now,
+        updated_at=now,
+        last_used_at=now
     )
 
     # Create an example Profile
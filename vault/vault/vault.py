@@ -17,9 +17,11 @@ import os
 import json
 import hashlib
 import base64
+import tempfile
 import time
 import secrets
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Optional, Tuple
 
 # Crypto primitives (requires `cryptography`)
@@ -35,8 +37,16 @@ try:
 except Exception:
     HAVE_ARGON2 = False
 
+# orjson (optional, preferred): Rust JSON codec, several times faster than
+# the stdlib on the small identity/secret blobs serialized on every write.
+try:
+    import orjson
+    HAVE_ORJSON = True
+except Exception:
+    HAVE_ORJSON = False
+
 # SQLAlchemy ORM
-from sqlalchemy import Column, Integer, LargeBinary, String, Text, create_engine
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String, Text, create_engine, event, select
 from sqlalchemy.orm import declarative_base, sessionmaker
 
 
@@ -49,6 +59,9 @@ SALT_LEN = 16
 MK_LEN = 32  # 256-bit master key
 DEK_LEN = 32  # 256-bit data encryption key
 WRAP_INFO = b"vault-dek-wrap-v1"  # AAD for DEK wrapping
+DEK_CACHE_MAX = 256  # unwrapped DEKs kept per unlocked session (LRU)
+FILE_CHUNK_SIZE = 32 * 1024  # plaintext bytes per AEAD frame in file blobs
+CHUNK_MAGIC = b"VCB1"  # header magic marking the framed (chunked) blob format
 ITERATIONS_PBKDF2 = 480_000  # fallback (tune for device). Argon2 preferred.
 
 Base = declarative_base()
@@ -66,6 +79,26 @@ def now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def blob_dumps(obj) -> bytes:
+    """Serializes a blob dataclass (or plain dict) to JSON bytes.
+
+    orjson walks dataclasses natively in C; the stdlib fallback uses the
+    blob's flat to_dict instead of asdict's reflective walk.
+    """
+    if HAVE_ORJSON:
+        return orjson.dumps(obj)
+    if not isinstance(obj, dict):
+        obj = obj.to_dict()
+    return json.dumps(obj).encode("utf-8")
+
+
+def blob_loads(data: bytes) -> dict:
+    """Deserializes blob plaintext back to a dict."""
+    if HAVE_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def sha256_hex(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
@@ -81,24 +114,38 @@ def b64d(s: str) -> bytes:
 # ------------------------
 # Key derivation: Master Key (MK)
 # ------------------------
-def derive_master_key(password: str, salt: bytes, use_argon2: bool = True) -> bytes:
+def _argon2_params() -> dict:
+    """
+    Argon2id parameters, overridable per device via environment variables.
+
+    Defaults: 64 MiB memory, time_cost 2, and one lane per CPU core —
+    Argon2's lanes run in parallel, so matching the core count cuts unlock
+    wall time at the same memory/time cost. Lower VAULT_ARGON2_MEM_KIB on
+    constrained devices.
+    """
+    return {
+        "time_cost": int(os.getenv("VAULT_ARGON2_TIME", "2")),
+        "memory_cost": int(os.getenv("VAULT_ARGON2_MEM_KIB", str(64 * 1024))),
+        "parallelism": int(os.getenv("VAULT_ARGON2_PAR", str(os.cpu_count() or 1))),
+    }
+
+
+def derive_master_key(password: str, salt: bytes, use_argon2: bool = True, params: Optional[dict] = None) -> bytes:
     """
     Derive a 32-byte master key from password+salt.
     Try Argon2 if available; else fall back to PBKDF2-HMAC-SHA256.
+    `params` overrides the environment-derived Argon2 parameters (callers
+    that persist params must pass the stored values on re-unlock).
     """
     password_bytes = password.encode('utf-8')
     if use_argon2 and HAVE_ARGON2:
-        # Argon2id with moderate params (tune these for each platform)
-        # NOTE: Argon2 params must be tuned: time_cost, memory_cost_kib, parallelism
-        time_cost = 2
-        memory_cost_kib = 64 * 1024  # 64 MB -- tune lower on low-end devices
-        parallelism = 1
+        p = params or _argon2_params()
         mk = hash_secret_raw(
             secret=password_bytes,
             salt=salt,
-            time_cost=time_cost,
-            memory_cost=memory_cost_kib,
-            parallelism=parallelism,
+            time_cost=p["time_cost"],
+            memory_cost=p["memory_cost"],
+            parallelism=p["parallelism"],
             hash_len=MK_LEN,
             type=Argon2Type.ID
         )
@@ -117,12 +164,34 @@ def derive_master_key(password: str, salt: bytes, use_argon2: bool = True) -> by
 # ------------------------
 # AEAD wrappers: encrypt/decrypt with AES-GCM
 # ------------------------
+# AESGCM(key) runs the full AES key schedule on construction; cache instances
+# per key so repeated calls with the same key (several blobs in one session,
+# multi-chunk files) pay it once. Bounded so abandoned DEKs don't accumulate.
+#
+# NOTE on throughput: the actual AES-GCM hot loop runs inside OpenSSL.
+# `cryptography`'s official wheels ship OpenSSL with the AES-NI + PCLMULQDQ
+# assembly paths enabled; if you build against a system OpenSSL, make sure it
+# was compiled with those (default on any non-exotic build) or expect ~10x
+# slower bulk encryption.
+_AESGCM_CACHE: dict = {}
+_AESGCM_CACHE_MAX = 64
+
+
+def _aesgcm_for(key: bytes) -> AESGCM:
+    aead = _AESGCM_CACHE.get(key)
+    if aead is None:
+        if len(_AESGCM_CACHE) >= _AESGCM_CACHE_MAX:
+            _AESGCM_CACHE.clear()
+        aead = _AESGCM_CACHE[key] = AESGCM(key)
+    return aead
+
+
 def aead_encrypt(key: bytes, plaintext: bytes, aad: Optional[bytes] = None) -> Tuple[bytes, bytes]:
     """
     Returns (nonce || ciphertext || tag, nonce) with AESGCM default 12-byte nonce.
     We'll store the combined ciphertext blob.
     """
-    aesgcm = AESGCM(key)
+    aesgcm = _aesgcm_for(key)
     nonce = secrets.token_bytes(12)
     ct = aesgcm.encrypt(nonce, plaintext, aad)
     return nonce + ct, nonce
@@ -132,11 +201,11 @@ def aead_decrypt(key: bytes, blob: bytes, aad: Optional[bytes] = None) -> bytes:
     """
     blob = nonce || ciphertext
     """
-    nonce = blob[:12]
-    ct = blob[12:]
-    aesgcm = AESGCM(key)
-    pt = aesgcm.decrypt(nonce, ct, aad)
-    return pt
+    # Slice through a memoryview: blob[12:] would copy the whole ciphertext
+    # just to strip the nonce, doubling transient memory on large blobs.
+    mv = memoryview(blob)
+    aesgcm = _aesgcm_for(key)
+    return aesgcm.decrypt(bytes(mv[:12]), mv[12:], aad)
 
 
 # ------------------------
@@ -168,13 +237,17 @@ def unwrap_dek(mk: bytes, wrapped_blob: bytes, aad: Optional[bytes] = None) -> b
 # ------------------------
 # Blob storage: write/read content-addressed encrypted blobs
 # ------------------------
+def _blob_path(h: str) -> str:
+    return os.path.join(BLOBS_DIR, h[:2], h[2:] + ".enc")
+
+
 def write_blob(ciphertext: bytes) -> str:
     """
     Content-addressed store: compute SHA-256 over ciphertext and save under blobs/sha256/<hash>.enc
     Returns the hex hash.
     """
     h = sha256_hex(ciphertext)
-    path = os.path.join(BLOBS_DIR, h[:2], h[2:] + ".enc")
+    path = _blob_path(h)
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "wb") as f:
         f.write(ciphertext)
@@ -182,18 +255,123 @@ def write_blob(ciphertext: bytes) -> str:
 
 
 def read_blob_by_hash(h: str) -> bytes:
-    path = os.path.join(BLOBS_DIR, h[:2], h[2:] + ".enc")
-    with open(path, "rb") as f:
+    with open(_blob_path(h), "rb") as f:
         return f.read()
 
 
+# ------------------------
+# Chunked (framed) blobs for file payloads
+# ------------------------
+# Large attachments are sealed as a sequence of AES-GCM frames instead of one
+# giant AEAD call, so peak memory stays O(FILE_CHUNK_SIZE) and encryption can
+# consume a stream. On-disk layout:
+#
+#   CHUNK_MAGIC || nonce_prefix(4) || [ct_len_u32 || ciphertext]...
+#
+# Each frame's nonce is nonce_prefix || counter_u64 (unique per frame under
+# one DEK; DEKs are never reused across blobs).
+
+def _chunk_nonce(prefix: bytes, counter: int) -> bytes:
+    return prefix + counter.to_bytes(8, "big")
+
+
+def _iter_chunks(source, chunk_size: int = FILE_CHUNK_SIZE):
+    """
+    Yields plaintext pieces from bytes, a file-like object, or any iterable
+    of bytes. Pieces from iterables are passed through as-is (frame sizes
+    are recorded per frame, so irregular sizes are fine).
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        mv = memoryview(source)
+        for off in range(0, len(mv), chunk_size):
+            yield bytes(mv[off:off + chunk_size])
+    elif hasattr(source, "read"):
+        while True:
+            piece = source.read(chunk_size)
+            if not piece:
+                break
+            yield piece
+    else:
+        yield from source
+
+
+def encrypt_file_to_blob(dek: bytes, source, aad: Optional[bytes] = None) -> Tuple[str, int]:
+    """
+    Encrypts `source` (bytes, file-like, or iterable of bytes) into a framed
+    blob, streaming frames to a temp file that is renamed into the
+    content-addressed path. Returns (blob_hash_hex, total_plaintext_size).
+    """
+    # One AESGCM (one AES key schedule) and one bound method for the whole
+    # blob, shared by every frame in the loop below.
+    encrypt = _aesgcm_for(dek).encrypt
+    prefix = secrets.token_bytes(4)
+    os.makedirs(BLOBS_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=BLOBS_DIR, suffix=".tmp")
+    total = 0
+    # Content address: SHA-256 over the framed on-disk bytes. The hasher is
+    # fed inside the encrypt loop so hashing overlaps encryption in one pass
+    # instead of re-reading the finished file.
+    h = hashlib.sha256()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(CHUNK_MAGIC)
+            f.write(prefix)
+            h.update(CHUNK_MAGIC)
+            h.update(prefix)
+            for counter, chunk in enumerate(_iter_chunks(source)):
+                total += len(chunk)
+                ct = encrypt(_chunk_nonce(prefix, counter), chunk, aad)
+                ct_len = len(ct).to_bytes(4, "big")
+                f.write(ct_len)
+                f.write(ct)
+                h.update(ct_len)
+                h.update(ct)
+        blob_hash = h.hexdigest()
+        path = _blob_path(blob_hash)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        return blob_hash, total
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def decrypt_blob_chunks(dek: bytes, blob_hash: str, aad: Optional[bytes] = None):
+    """
+    Yields decrypted plaintext chunks from a framed blob. Blobs written
+    before the framed format (no CHUNK_MAGIC header) are decrypted in one
+    shot and yielded as a single chunk.
+    """
+    with open(_blob_path(blob_hash), "rb") as f:
+        head = f.read(len(CHUNK_MAGIC) + 4)
+        if head[:len(CHUNK_MAGIC)] != CHUNK_MAGIC:
+            # Legacy single-frame blob: nonce || ciphertext
+            yield aead_decrypt(dek, head + f.read(), aad)
+            return
+        prefix = head[len(CHUNK_MAGIC):]
+        decrypt = _aesgcm_for(dek).decrypt
+        counter = 0
+        while True:
+            len_bytes = f.read(4)
+            if not len_bytes:
+                break
+            ct = f.read(int.from_bytes(len_bytes, "big"))
+            yield decrypt(_chunk_nonce(prefix, counter), ct, aad)
+            counter += 1
+
+
 # ------------------------
 # ORM models (non-sensitive meta + wrapped DEKs)
 # ------------------------
 class Item(Base):
     __tablename__ = "items"
 
-    item_id = Column(String, primary_key=True)
+    # Surrogate integer primary key: an alias for SQLite's rowid, so B-tree
+    # lookups and foreign-key joins compare 8-byte ints instead of strings.
+    # The external item_id string stays unique + indexed for API lookups.
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    item_id = Column(String, unique=True, index=True)
     domain = Column(String)
     title = Column(String)
     detail_blob_hash = Column(String)
@@ -210,8 +388,9 @@ class Item(Base):
 class Secret(Base):
     __tablename__ = "secrets"
 
-    secret_id = Column(String, primary_key=True)
-    item_id = Column(String)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    secret_id = Column(String, unique=True, index=True)
+    item_fk = Column(Integer, ForeignKey("items.id"), index=True)
     blob_hash = Column(String)
     dek_wrap = Column(LargeBinary)
     secret_type = Column(String)
@@ -222,8 +401,9 @@ class Secret(Base):
 class File(Base):
     __tablename__ = "files"
 
-    file_id = Column(String, primary_key=True)
-    item_id = Column(String)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    file_id = Column(String, unique=True, index=True)
+    item_fk = Column(Integer, ForeignKey("items.id"), index=True)
     blob_hash = Column(String)
     dek_wrap = Column(LargeBinary)
     filename = Column(String)
@@ -272,7 +452,11 @@ def decrypt_blob_with_wrapped_dek(mk: bytes, blob_hash: str, wrapped_dek: bytes,
 # ------------------------
 # Data classes for JSON blobs
 # ------------------------
-@dataclass
+# slots=True drops the per-instance __dict__, and the explicit to_dict
+# methods replace asdict's reflective field walk (dataclasses.fields +
+# deepcopy per call) with one flat dict literal — the blob fields hold
+# plain JSON-ready values, so no deep copy is needed.
+@dataclass(slots=True)
 class IdentityBlob:
     schema: str
     item_id: str
@@ -287,8 +471,24 @@ class IdentityBlob:
     site_specific: Optional[dict] = None
     audit: Optional[dict] = None
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "schema": self.schema,
+            "item_id": self.item_id,
+            "name": self.name,
+            "dob": self.dob,
+            "email": self.email,
+            "phone": self.phone,
+            "address": self.address,
+            "national_id": self.national_id,
+            "tags": self.tags,
+            "notes": self.notes,
+            "site_specific": self.site_specific,
+            "audit": self.audit,
+        }
+
+
+@dataclass(slots=True)
 class SecretBlob:
     schema: str
     secret_id: str
@@ -300,8 +500,21 @@ class SecretBlob:
     history: Optional[list] = None
     audit: Optional[dict] = None
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            "schema": self.schema,
+            "secret_id": self.secret_id,
+            "type": self.type,
+            "username": self.username,
+            "password": self.password,
+            "totp_uri": self.totp_uri,
+            "notes": self.notes,
+            "history": self.history,
+            "audit": self.audit,
+        }
+
+
+@dataclass(slots=True)
 class FileBlobMeta:
     schema: str
     file_id: str
@@ -311,6 +524,16 @@ class FileBlobMeta:
     audit: Optional[dict] = None
     # The actual file bytes are encrypted and stored as a separate blob; this JSON contains metadata and pointers if needed.
 
+    def to_dict(self) -> dict:
+        return {
+            "schema": self.schema,
+            "file_id": self.file_id,
+            "filename": self.filename,
+            "mime_type": self.mime_type,
+            "description": self.description,
+            "audit": self.audit,
+        }
+
 
 # ------------------------
 # High-level APIs
@@ -320,12 +543,71 @@ class Vault:
         ensure_dirs()
         self.db_path = db_path
         self.engine = create_engine(f"sqlite:///{self.db_path}", connect_args={"check_same_thread": False})
+
+        @event.listens_for(self.engine, "connect")
+        def _set_sqlite_pragmas(dbapi_conn, _record):
+            # WAL lets readers proceed during writes and turns each commit
+            # into an append; NORMAL skips the WAL fsync on every commit
+            # (still durable at checkpoint). The rest trades memory for I/O:
+            # mmap'd reads, in-memory temp tables, 64 MiB page cache.
+            cursor = dbapi_conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA mmap_size=268435456")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.close()
+
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=False)
+        self._migrate_legacy_schema()
         Base.metadata.create_all(self.engine)
         self.mk: Optional[bytes] = None
         self.salt: Optional[bytes] = None
+        # Pre-built AEAD context for DEK wrapping, derived once per unlock
+        self._wrap_aead: Optional[AESGCM] = None
+        # Unwrapped-DEK LRU, created on unlock and dropped on lock
+        self._dek_cache: Optional[OrderedDict] = None
         self._ensure_salt()
 
+    def _migrate_legacy_schema(self):
+        """
+        Rebuilds databases written before the surrogate-key change, whose
+        tables used string primary keys and had no integer id column.
+        SQLite cannot alter a primary key in place, so the legacy tables are
+        renamed aside, the current schema is created, rows are copied across
+        with item references resolved to the new integer keys, and the old
+        tables are dropped. No-op for fresh or already-migrated databases.
+        """
+        with self.engine.begin() as conn:
+            cols = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(items)")}
+            if not cols or "id" in cols:
+                return
+            for table in ("items", "secrets", "files"):
+                conn.exec_driver_sql(f"ALTER TABLE {table} RENAME TO {table}_legacy")
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as conn:
+            conn.exec_driver_sql(
+                "INSERT INTO items (item_id, domain, title, detail_blob_hash, detail_dek_wrap,"
+                " has_attachments, site_type, trust_level, created_at, updated_at, version, tombstoned)"
+                " SELECT item_id, domain, title, detail_blob_hash, detail_dek_wrap,"
+                " has_attachments, site_type, trust_level, created_at, updated_at, version, tombstoned"
+                " FROM items_legacy"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO secrets (secret_id, item_fk, blob_hash, dek_wrap, secret_type, created_at, updated_at)"
+                " SELECT s.secret_id, i.id, s.blob_hash, s.dek_wrap, s.secret_type, s.created_at, s.updated_at"
+                " FROM secrets_legacy s JOIN items i ON i.item_id = s.item_id"
+            )
+            conn.exec_driver_sql(
+                "INSERT INTO files (file_id, item_fk, blob_hash, dek_wrap, filename, mime_type,"
+                " size_bytes, created_at, updated_at)"
+                " SELECT f.file_id, i.id, f.blob_hash, f.dek_wrap, f.filename, f.mime_type,"
+                " f.size_bytes, f.created_at, f.updated_at"
+                " FROM files_legacy f JOIN items i ON i.item_id = f.item_id"
+            )
+            for table in ("files_legacy", "secrets_legacy", "items_legacy"):
+                conn.exec_driver_sql(f"DROP TABLE {table}")
+
     def _ensure_salt(self):
         # salt stored in meta table; if not present, will be created
         with self.Session() as session:
@@ -339,15 +621,107 @@ class Vault:
             session.commit()
             self.salt = salt
 
+    def _argon2_params_for_db(self) -> dict:
+        """
+        Returns the Argon2 params for this vault, storing them in the meta
+        table on first unlock so later unlocks derive the same key even if
+        the environment (or default core count) changes.
+        """
+        with self.Session() as session:
+            row = session.get(Meta, "argon2_params")
+            if row:
+                return json.loads(row.value)
+            if session.query(Item.id).first() is not None:
+                # A populated vault with no stored params predates this
+                # change, so its master key was derived with the old
+                # hardcoded values. Seed the row with those — the current
+                # defaults (notably parallelism = core count) would derive
+                # a different key and every DEK unwrap would fail as if the
+                # password were wrong.
+                params = {"time_cost": 2, "memory_cost": 64 * 1024, "parallelism": 1}
+            else:
+                params = _argon2_params()
+            session.merge(Meta(key="argon2_params", value=json.dumps(params)))
+            session.commit()
+            return params
+
     def unlock(self, password: str, use_argon2: bool = True):
         """
         Derive MK and hold in memory. In production, wrap MK with OS keystore for biometric unlocking.
         """
-        self.mk = derive_master_key(password, self.salt, use_argon2=use_argon2)
+        params = self._argon2_params_for_db() if (use_argon2 and HAVE_ARGON2) else None
+        self.mk = derive_master_key(password, self.salt, use_argon2=use_argon2, params=params)
+        # Derive the wrap key and run the AES key schedule once per session
+        # instead of per blob (one HKDF + one AESGCM construction per call).
+        self._wrap_aead = AESGCM(derive_wrap_key(self.mk))
+        # Read-heavy flows (autofill) hit the same few secrets repeatedly;
+        # caching their unwrapped DEKs skips the AES-GCM unwrap per load.
+        self._dek_cache = OrderedDict()
 
     def lock(self):
         # Zero out mk if possible (best effort in Python)
         self.mk = None
+        self._wrap_aead = None
+        self._dek_cache = None
+        # The AEAD cache keys are raw DEK/wrap-key bytes; locking must not
+        # leave any of them resident.
+        _AESGCM_CACHE.clear()
+
+    # ---- DEK wrap/unwrap via the cached session wrap key ----
+    def _wrap_dek(self, dek: bytes, aad: Optional[bytes] = None) -> bytes:
+        nonce = secrets.token_bytes(12)
+        return nonce + self._wrap_aead.encrypt(nonce, dek, aad or WRAP_INFO)
+
+    def _unwrap_dek(self, wrapped_blob: bytes, aad: Optional[bytes] = None) -> bytes:
+        # Keyed on (ciphertext, aad): the GCM tag binds both, so a cache hit
+        # stands in for exactly the authenticated unwrap it replaces.
+        cache = self._dek_cache
+        key = (bytes(wrapped_blob), aad)
+        if cache is not None:
+            dek = cache.get(key)
+            if dek is not None:
+                cache.move_to_end(key)
+                return dek
+        dek = self._wrap_aead.decrypt(wrapped_blob[:12], wrapped_blob[12:], aad or WRAP_INFO)
+        if cache is not None:
+            if len(cache) >= DEK_CACHE_MAX:
+                cache.popitem(last=False)
+            cache[key] = dek
+        return dek
+
+    def _encrypt_and_store_blob(self, plaintext_bytes: bytes, aad: Optional[bytes] = None) -> Tuple[str, bytes]:
+        """
+        Same flow as the module-level encrypt_and_store_blob, but wraps the
+        DEK through the cached session AEAD instead of re-deriving the wrap
+        key via HKDF on every call.
+        """
+        dek = make_dek()
+        ciphertext, _nonce = aead_encrypt(dek, plaintext_bytes, aad=aad)
+        blob_hash = write_blob(ciphertext)
+        wrapped_dek = self._wrap_dek(dek, aad=aad)
+        return blob_hash, wrapped_dek
+
+    def _reencrypt_blob(self, plaintext_bytes: bytes, wrapped_dek: bytes, aad: Optional[bytes] = None) -> str:
+        """
+        Re-encrypts updated plaintext under the blob's existing DEK with a
+        fresh nonce. Updates keep the stored wrapped DEK valid as-is, saving
+        a DEK generation plus an AES-GCM wrap per update.
+        """
+        dek = self._unwrap_dek(wrapped_dek, aad=aad)
+        ciphertext, _nonce = aead_encrypt(dek, plaintext_bytes, aad=aad)
+        return write_blob(ciphertext)
+
+    def _decrypt_blob(self, blob_hash: str, wrapped_dek: bytes, aad: Optional[bytes] = None) -> bytes:
+        ciphertext = read_blob_by_hash(blob_hash)
+        dek = self._unwrap_dek(wrapped_dek, aad=aad)
+        return aead_decrypt(dek, ciphertext, aad=aad)
+
+    def _item_pk(self, session, item_id: str) -> int:
+        """Resolves an external item_id string to its integer primary key."""
+        pk = session.query(Item.id).filter(Item.item_id == item_id).scalar()
+        if pk is None:
+            raise KeyError("Item not found")
+        return pk
 
     # ---- Identity operations ----
     def create_identity(self, item_id: str, domain: str, name: str, pii: dict, site_type: str = "generic", trust_level: int = 0):
@@ -366,8 +740,8 @@ class Vault:
             site_specific=pii.get("site_specific", {}),
             audit={"created_at": now_ms(), "updated_at": now_ms()}
         )
-        plaintext = json.dumps(asdict(blob)).encode("utf-8")
-        blob_hash, wrapped_dek = encrypt_and_store_blob(self.mk, plaintext, aad=item_id.encode())
+        plaintext = blob_dumps(blob)
+        blob_hash, wrapped_dek = self._encrypt_and_store_blob(plaintext, aad=item_id.encode())
         ts = now_ms()
         with self.Session() as session:
             session.add(Item(
@@ -390,11 +764,11 @@ class Vault:
     def load_identity(self, item_id: str) -> IdentityBlob:
         assert self.mk is not None, "Vault locked"
         with self.Session() as session:
-            item = session.get(Item, item_id)
+            item = session.query(Item).filter(Item.item_id == item_id).one_or_none()
             if not item:
                 raise KeyError("Item not found")
-            plaintext = decrypt_blob_with_wrapped_dek(self.mk, item.detail_blob_hash, item.detail_dek_wrap, aad=item_id.encode())
-            obj = json.loads(plaintext.decode("utf-8"))
+            plaintext = self._decrypt_blob(item.detail_blob_hash, item.detail_dek_wrap, aad=item_id.encode())
+            obj = blob_loads(plaintext)
             return IdentityBlob(**obj)
 
     def update_identity(self, item_id: str, updates: dict) -> IdentityBlob:
@@ -403,15 +777,17 @@ class Vault:
         """
         assert self.mk is not None, "Vault locked"
         with self.Session() as session:
-            item = session.get(Item, item_id)
+            item = session.query(Item).filter(Item.item_id == item_id).one_or_none()
             if not item:
                 raise KeyError("Item not found")
 
-            plaintext = decrypt_blob_with_wrapped_dek(self.mk, item.detail_blob_hash, item.detail_dek_wrap, aad=item_id.encode())
-            obj = json.loads(plaintext.decode("utf-8"))
+            plaintext = self._decrypt_blob(item.detail_blob_hash, item.detail_dek_wrap, aad=item_id.encode())
+            obj = blob_loads(plaintext)
 
-            # merge updates shallowly
-            obj.update({k: v for k, v in updates.items() if v is not None})
+            # "domain" lives only in the index table; everything else is a
+            # blob field and forces a re-encrypt.
+            blob_updates = {k: v for k, v in updates.items() if k != "domain" and v is not None}
+            obj.update(blob_updates)
             obj.setdefault("audit", {})
             obj["audit"]["updated_at"] = now_ms()
 
@@ -422,16 +798,107 @@ class Vault:
                 item.domain = updates["domain"]
 
             ts = now_ms()
-            new_blob = json.dumps(obj).encode("utf-8")
-            blob_hash, wrapped_dek = encrypt_and_store_blob(self.mk, new_blob, aad=item_id.encode())
-
-            item.detail_blob_hash = blob_hash
-            item.detail_dek_wrap = wrapped_dek
+            if blob_updates:
+                # Re-encrypt under the existing DEK (fresh nonce) so the
+                # stored wrapped DEK stays valid; index-only updates skip
+                # the blob write entirely.
+                new_blob = blob_dumps(obj)
+                item.detail_blob_hash = self._reencrypt_blob(new_blob, item.detail_dek_wrap, aad=item_id.encode())
             item.updated_at = ts
             item.version = (item.version or 1) + 1
             session.commit()
             return IdentityBlob(**obj)
 
+    def create_items_bulk(self, items: list) -> list:
+        """
+        Bulk identity import (e.g. restore from backup). Each entry is a dict
+        with item_id, domain, name, pii and optionally site_type/trust_level.
+
+        All blobs are encrypted up front, then every row is inserted through
+        the Core insert path in a single transaction — one commit/fsync for
+        the whole batch instead of one per row.
+        """
+        assert self.mk is not None, "Vault locked"
+        ts = now_ms()
+        rows = []
+        for entry in items:
+            item_id = entry["item_id"]
+            pii = entry.get("pii", {})
+            blob = IdentityBlob(
+                schema="vault.identity@1",
+                item_id=item_id,
+                name=entry["name"],
+                dob=pii.get("dob"),
+                email=pii.get("email"),
+                phone=pii.get("phone"),
+                address=pii.get("address"),
+                national_id=pii.get("national_id"),
+                tags=pii.get("tags", []),
+                notes=pii.get("notes"),
+                site_specific=pii.get("site_specific", {}),
+                audit={"created_at": ts, "updated_at": ts}
+            )
+            plaintext = blob_dumps(blob)
+            blob_hash, wrapped_dek = self._encrypt_and_store_blob(plaintext, aad=item_id.encode())
+            rows.append({
+                "item_id": item_id,
+                "domain": entry["domain"],
+                "title": entry["name"],
+                "detail_blob_hash": blob_hash,
+                "detail_dek_wrap": wrapped_dek,
+                "has_attachments": 0,
+                "site_type": entry.get("site_type", "generic"),
+                "trust_level": entry.get("trust_level", 0),
+                "created_at": ts,
+                "updated_at": ts,
+                "version": 1,
+                "tombstoned": 0,
+            })
+        with self.Session() as session:
+            session.execute(Item.__table__.insert(), rows)
+            session.commit()
+        return [r["item_id"] for r in rows]
+
+    def create_secrets_bulk(self, secrets_in: list) -> list:
+        """
+        Bulk secret import; same single-transaction Core insert pattern as
+        create_items_bulk. Each entry is a dict with secret_id, item_id,
+        secret_type and optionally username/password/totp_uri/notes.
+        """
+        assert self.mk is not None, "Vault locked"
+        ts = now_ms()
+        rows = []
+        for entry in secrets_in:
+            secret_id = entry["secret_id"]
+            blob = SecretBlob(
+                schema="vault.secret@1",
+                secret_id=secret_id,
+                type=entry["secret_type"],
+                username=entry.get("username"),
+                password=entry.get("password"),
+                totp_uri=entry.get("totp_uri"),
+                notes=entry.get("notes"),
+                history=[],
+                audit={"created_at": ts, "updated_at": ts}
+            )
+            plaintext = blob_dumps(blob)
+            blob_hash, wrapped_dek = self._encrypt_and_store_blob(plaintext, aad=secret_id.encode())
+            rows.append({
+                "secret_id": secret_id,
+                "item_id": entry["item_id"],  # resolved to item_fk below
+                "blob_hash": blob_hash,
+                "dek_wrap": wrapped_dek,
+                "secret_type": entry["secret_type"],
+                "created_at": ts,
+                "updated_at": ts,
+            })
+        with self.Session() as session:
+            for row in rows:
+                row["item_fk"] = self._item_pk(session, row.pop("item_id"))
+            session.execute(Secret.__table__.insert(), rows)
+            session.commit()
+        return [r["secret_id"] for r in rows]
+
     # ---- Secret operations ----
     def create_secret(self, secret_id: str, item_id: str, secret_type: str, username: Optional[str], password: Optional[str], totp_uri: Optional[str] = None, notes: Optional[str] = None):
         assert self.mk is not None, "Vault locked"
@@ -446,13 +913,13 @@ class Vault:
             history=[],
             audit={"created_at": now_ms(), "updated_at": now_ms()}
         )
-        plaintext = json.dumps(asdict(blob)).encode("utf-8")
-        blob_hash, wrapped_dek = encrypt_and_store_blob(self.mk, plaintext, aad=secret_id.encode())
+        plaintext = blob_dumps(blob)
+        blob_hash, wrapped_dek = self._encrypt_and_store_blob(plaintext, aad=secret_id.encode())
         ts = now_ms()
         with self.Session() as session:
             session.add(Secret(
                 secret_id=secret_id,
-                item_id=item_id,
+                item_fk=self._item_pk(session, item_id),
                 blob_hash=blob_hash,
                 dek_wrap=wrapped_dek,
                 secret_type=secret_type,
@@ -465,11 +932,11 @@ class Vault:
     def load_secret(self, secret_id: str) -> SecretBlob:
         assert self.mk is not None, "Vault locked"
         with self.Session() as session:
-            secret = session.get(Secret, secret_id)
+            secret = session.query(Secret).filter(Secret.secret_id == secret_id).one_or_none()
             if not secret:
                 raise KeyError("Secret not found")
-            plaintext = decrypt_blob_with_wrapped_dek(self.mk, secret.blob_hash, secret.dek_wrap, aad=secret_id.encode())
-            obj = json.loads(plaintext.decode("utf-8"))
+            plaintext = self._decrypt_blob(secret.blob_hash, secret.dek_wrap, aad=secret_id.encode())
+            obj = blob_loads(plaintext)
             return SecretBlob(**obj)
 
     def update_secret(self, secret_id: str, updates: dict) -> SecretBlob:
@@ -478,43 +945,51 @@ class Vault:
         """
         assert self.mk is not None, "Vault locked"
         with self.Session() as session:
-            secret = session.get(Secret, secret_id)
+            secret = session.query(Secret).filter(Secret.secret_id == secret_id).one_or_none()
             if not secret:
                 raise KeyError("Secret not found")
 
-            plaintext = decrypt_blob_with_wrapped_dek(self.mk, secret.blob_hash, secret.dek_wrap, aad=secret_id.encode())
-            obj = json.loads(plaintext.decode("utf-8"))
+            plaintext = self._decrypt_blob(secret.blob_hash, secret.dek_wrap, aad=secret_id.encode())
+            obj = blob_loads(plaintext)
 
-            obj.update({k: v for k, v in updates.items() if v is not None})
+            blob_updates = {k: v for k, v in updates.items() if v is not None}
+            obj.update(blob_updates)
             obj.setdefault("audit", {})
             obj["audit"]["updated_at"] = now_ms()
 
             ts = now_ms()
-            new_blob = json.dumps(obj).encode("utf-8")
-            blob_hash, wrapped_dek = encrypt_and_store_blob(self.mk, new_blob, aad=secret_id.encode())
-
-            secret.blob_hash = blob_hash
-            secret.dek_wrap = wrapped_dek
+            if blob_updates:
+                # Same DEK-reuse path as update_identity: fresh nonce, same
+                # wrapped DEK, no HKDF or rewrap work.
+                new_blob = blob_dumps(obj)
+                secret.blob_hash = self._reencrypt_blob(new_blob, secret.dek_wrap, aad=secret_id.encode())
             secret.updated_at = ts
             session.commit()
             return SecretBlob(**obj)
 
     # ---- File operations ----
-    def add_file(self, file_id: str, item_id: str, filename: str, mime_type: str, file_bytes: bytes, description: Optional[str] = None):
+    def add_file(self, file_id: str, item_id: str, filename: str, mime_type: str, file_bytes, description: Optional[str] = None):
+        """
+        Stores a file as a chunk-framed encrypted blob. `file_bytes` may be
+        bytes, a file-like object, or an iterable of bytes chunks, so large
+        attachments never need to be buffered whole.
+        """
         assert self.mk is not None, "Vault locked"
-        # store file bytes as a blob (separate from JSON metadata)
-        file_blob_hash, file_wrapped_dek = encrypt_and_store_blob(self.mk, file_bytes, aad=file_id.encode())
+        # store file bytes as framed blob chunks (separate from JSON metadata)
+        dek = make_dek()
+        file_blob_hash, size_bytes = encrypt_file_to_blob(dek, file_bytes, aad=file_id.encode())
+        file_wrapped_dek = self._wrap_dek(dek, aad=file_id.encode())
         # metadata blob (small JSON) - could be inline in DB; we use files table meta only
         ts = now_ms()
         with self.Session() as session:
             session.add(File(
                 file_id=file_id,
-                item_id=item_id,
+                item_fk=self._item_pk(session, item_id),
                 blob_hash=file_blob_hash,
                 dek_wrap=file_wrapped_dek,
                 filename=filename,
                 mime_type=mime_type,
-                size_bytes=len(file_bytes),
+                size_bytes=size_bytes,
                 created_at=ts,
                 updated_at=ts
             ))
@@ -523,37 +998,59 @@ class Vault:
             session.commit()
         return file_blob_hash
 
-    def load_file(self, file_id: str) -> bytes:
+    def load_file_stream(self, file_id: str):
+        """
+        Yields decrypted chunks of a stored file one frame at a time, so a
+        caller (e.g. an HTTP response) can stream it to its destination with
+        O(chunk) peak memory instead of buffering the whole plaintext.
+        """
         assert self.mk is not None, "Vault locked"
         with self.Session() as session:
-            file_row = session.get(File, file_id)
+            file_row = session.query(File).filter(File.file_id == file_id).one_or_none()
             if not file_row:
                 raise KeyError("File not found")
-            plaintext = decrypt_blob_with_wrapped_dek(self.mk, file_row.blob_hash, file_row.dek_wrap, aad=file_id.encode())
-            return plaintext
+            blob_hash, dek_wrap = file_row.blob_hash, file_row.dek_wrap
+        dek = self._unwrap_dek(dek_wrap, aad=file_id.encode())
+        return decrypt_blob_chunks(dek, blob_hash, aad=file_id.encode())
+
+    def get_file_info(self, file_id: str) -> dict:
+        """Returns filename/mime/size metadata without touching the blob."""
+        with self.Session() as session:
+            row = session.execute(
+                select(File.file_id, File.filename, File.mime_type, File.size_bytes)
+                .where(File.file_id == file_id)
+            ).first()
+            if not row:
+                raise KeyError("File not found")
+            return dict(row._mapping)
+
+    def load_file(self, file_id: str) -> bytes:
+        return b"".join(self.load_file_stream(file_id))
 
     # ---- Utility: list items ----
     def list_items(self):
         with self.Session() as session:
-            items = session.query(Item).order_by(Item.updated_at.desc()).all()
-            return [
-                {
-                    "item_id": i.item_id,
-                    "domain": i.domain,
-                    "title": i.title,
-                    "created_at": i.created_at,
-                    "updated_at": i.updated_at,
-                }
-                for i in items
-            ]
+            # Core column projection: listing needs five plain columns, so
+            # skip building full ORM Item instances (attribute dicts plus
+            # identity-map registration) per row. The integer PK is
+            # insertion-ordered, so newest-first comes straight off the
+            # rowid B-tree with no sort pass.
+            rows = session.execute(
+                select(Item.item_id, Item.domain, Item.title, Item.created_at, Item.updated_at)
+                .order_by(Item.id.desc())
+            ).all()
+            return [dict(r._mapping) for r in rows]
 
     def list_secrets_for_item(self, item_id: str):
         """
         Return lightweight secret metadata for a given item_id.
         """
         with self.Session() as session:
-            secrets_rows = session.query(Secret.secret_id, Secret.secret_type).filter(Secret.item_id == item_id).all()
-            return [{"secret_id": sid, "secret_type": stype} for sid, stype in secrets_rows]
+            rows = session.execute(
+                select(Secret.secret_id, Secret.secret_type)
+                .where(Secret.item_fk == self._item_pk(session, item_id))
+            ).all()
+            return [dict(r._mapping) for r in rows]
 
 
 # ------------------------
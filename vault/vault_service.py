@@ -1,10 +1,12 @@
 import asyncio
 import os
 import secrets
+import threading
+import time
 from typing import Optional
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 
 from email_aliases.api import SimpleLoginClient
@@ -13,6 +15,24 @@ from profile_secrets.generator import generate_secure_password
 from vault.vault import Vault
 
 
+_ULID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _ulid() -> str:
+    """
+    26-char Crockford-base32 ULID: 48-bit millisecond timestamp followed by
+    80 random bits. Lexicographic order matches creation order, so ids
+    double as a recency sort key and inserts append at the right edge of
+    the index instead of fragmenting it.
+    """
+    value = (int(time.time() * 1000) << 80) | int.from_bytes(secrets.token_bytes(10), "big")
+    chars = [''] * 26
+    for i in range(25, -1, -1):
+        chars[i] = _ULID_ALPHABET[value & 31]
+        value >>= 5
+    return "".join(chars)
+
+
 def _stringify_domain(value):
     """
     Accepts string or alias-like dict, returns string domain/email.
@@ -42,6 +62,18 @@ class VaultService:
 
     def __init__(self, vault: Optional[Vault] = None):
         self.vault = vault or Vault()
+        # Persistent event loop on a daemon thread. asyncio.run per request
+        # would build a fresh loop and HTTP client each time, throwing away
+        # the warm connection pool between alias calls.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="vault-async", daemon=True)
+        self._loop_thread.start()
+        self._sl_client: Optional[SimpleLoginClient] = None
+
+    def _run_async(self, coro):
+        """Runs a coroutine on the persistent loop and waits for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     # ---- Vault lifecycle ----
     def unlock(self, password: str, use_argon2: bool = True):
@@ -66,11 +98,16 @@ class VaultService:
 
     # ---- Email alias (SimpleLogin) ----
     async def _create_alias_async(self, api_key: str, hostname: Optional[str], mode: str, note: Optional[str]):
-        async with SimpleLoginClient(api_key=api_key) as client:
-            return await client.aliases.create_random_alias(hostname=hostname, mode=mode, note=note)
+        # One client for the service lifetime; swapping the key in place
+        # keeps the TLS session warm across requests.
+        if self._sl_client is None:
+            self._sl_client = SimpleLoginClient(api_key=api_key)
+        else:
+            self._sl_client.set_api_key(api_key)
+        return await self._sl_client.aliases.create_random_alias(hostname=hostname, mode=mode, note=note)
 
     def create_alias(self, api_key: str, hostname: Optional[str] = None, mode: str = "word", note: Optional[str] = None):
-        alias_obj = asyncio.run(self._create_alias_async(api_key, hostname, mode, note))
+        alias_obj = self._run_async(self._create_alias_async(api_key, hostname, mode, note))
         # ensure JSON-serializable
         if hasattr(alias_obj, "model_dump"):
             return alias_obj.model_dump()
@@ -79,7 +116,7 @@ class VaultService:
     # ---- Vault operations ----
     def create_identity(self, domain: str, name: str, pii: dict, site_type: str = "generic", trust_level: int = 0, item_id: Optional[str] = None):
         self._require_unlocked()
-        iid = item_id or f"item-{secrets.token_hex(8)}"
+        iid = item_id or f"item-{_ulid()}"
         domain_str = _stringify_domain(domain)
         title_str = _stringify_title(name)
         blob_hash = self.vault.create_identity(iid, domain_str, title_str, pii, site_type=site_type, trust_level=trust_level)
@@ -96,7 +133,7 @@ class VaultService:
 
     def create_secret(self, item_id: str, secret_type: str, username: Optional[str], password: Optional[str], totp_uri: Optional[str] = None, notes: Optional[str] = None, secret_id: Optional[str] = None):
         self._require_unlocked()
-        sid = secret_id or f"sec-{secrets.token_hex(8)}"
+        sid = secret_id or f"sec-{_ulid()}"
         blob_hash = self.vault.create_secret(sid, item_id, secret_type, username, password, totp_uri=totp_uri, notes=notes)
         return {"secret_id": sid, "blob_hash": blob_hash}
 
@@ -117,6 +154,14 @@ class VaultService:
         self._require_unlocked()
         return self.vault.list_secrets_for_item(item_id)
 
+    def load_file_stream(self, file_id: str):
+        self._require_unlocked()
+        return self.vault.load_file_stream(file_id)
+
+    def get_file_info(self, file_id: str):
+        self._require_unlocked()
+        return self.vault.get_file_info(file_id)
+
 
 def create_app(service: Optional[VaultService] = None) -> Flask:
     load_dotenv()
@@ -178,12 +223,12 @@ def create_app(service: Optional[VaultService] = None) -> Flask:
     def update_identity(item_id: str):
         data = request.get_json(force=True)
         blob = svc.update_identity(item_id, data)
-        return jsonify(blob.__dict__)
+        return jsonify(blob.to_dict())
 
     @app.get("/identity/<item_id>")
     def load_identity(item_id: str):
         blob = svc.load_identity(item_id)
-        return jsonify(blob.__dict__)
+        return jsonify(blob.to_dict())
 
     @app.post("/secret")
     def create_secret():
@@ -206,12 +251,12 @@ def create_app(service: Optional[VaultService] = None) -> Flask:
     def update_secret(secret_id: str):
         data = request.get_json(force=True)
         blob = svc.update_secret(secret_id, data)
-        return jsonify(blob.__dict__)
+        return jsonify(blob.to_dict())
 
     @app.get("/secret/<secret_id>")
     def load_secret(secret_id: str):
         blob = svc.load_secret(secret_id)
-        return jsonify(blob.__dict__)
+        return jsonify(blob.to_dict())
 
     @app.get("/items")
     def list_items():
@@ -222,6 +267,21 @@ def create_app(service: Optional[VaultService] = None) -> Flask:
         rows = svc.list_secrets_for_item(item_id)
         return jsonify(rows)
 
+    @app.get("/file/<file_id>")
+    def get_file(file_id: str):
+        # Streamed response: Flask iterates the generator and writes each
+        # decrypted frame to the socket, so peak memory stays at one chunk
+        # rather than the whole file.
+        info = svc.get_file_info(file_id)
+        return Response(
+            svc.load_file_stream(file_id),
+            mimetype=info["mime_type"] or "application/octet-stream",
+            headers={
+                "Content-Disposition": f'attachment; filename="{info["filename"]}"',
+                "Content-Length": str(info["size_bytes"]),
+            },
+        )
+
     return app
 
 